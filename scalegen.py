@@ -1,14 +1,23 @@
 #!/usr/bin/env python
 
+import array
+import functools
 import os
-from typing import Any, List
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
+import mido
+import numpy as np
+import numpy.typing as npt
 import pretty_midi
 from typing_extensions import Literal
 
 # We are using a high precision ticks-per-quarter (= PPQ) resolution
 PPQ_RESOLUTION = 960
 
+_PIANO_PROGRAM: int = pretty_midi.instrument_name_to_program("Acoustic Grand Piano")
+
 
 # -----------------------------------------------------------------------------
 # Pattern helpers
@@ -18,18 +27,28 @@ Pattern = List[int]
 
 
 def get_start_pitches(
-    pattern: Pattern, low: int, high: int, cycle_up_down: bool = True
-) -> List[int]:
-    min_delta = min(pattern)
-    max_delta = max(pattern)
+    pattern: Sequence[int], low: int, high: int, cycle_up_down: bool = True
+) -> npt.NDArray[np.int16]:
+    """
+    Note that the returned array is cached and therefore read-only.
+    """
+    return _get_start_pitches(tuple(pattern), low, high, cycle_up_down)
+
 
-    lowest = low - min_delta
-    highest = high - max_delta
+@functools.lru_cache(maxsize=128)
+def _get_start_pitches(
+    pattern: Tuple[int, ...], low: int, high: int, cycle_up_down: bool
+) -> npt.NDArray[np.int16]:
+    lowest = low - min(pattern)
+    highest = high - max(pattern)
 
+    up = np.arange(lowest, highest + 1, dtype=np.int16)
     if not cycle_up_down:
-        return list(range(lowest, highest + 1))
+        start_pitches = up
     else:
-        return list(range(lowest, highest + 1)) + list(reversed(range(lowest, highest)))
+        start_pitches = np.concatenate([up, up[-2::-1]])
+    start_pitches.setflags(write=False)
+    return start_pitches
 
 
 def close_pattern(pattern: Pattern) -> Pattern:
@@ -41,41 +60,80 @@ def close_pattern(pattern: Pattern) -> Pattern:
 # -----------------------------------------------------------------------------
 
 
-def _render_midi(
-    midifile: pretty_midi.PrettyMIDI,
-    basename: str,
-    delete_wave: bool = True,
-) -> None:
+def _render_midi(basename: str) -> None:
     """
+    Renders the already written `<basename>.mid` to `<basename>.mp3`. The raw audio
+    output of FluidSynth is piped directly into LAME, so no intermediate WAV file
+    is written to disk.
+
     Requires system packages: fluidsynth fluid-soundfont-gm lame
     http://wootangent.net/2010/11/converting-midi-to-wav-or-mp3-the-easy-way/
     """
     filename_mid = basename + ".mid"
-    filename_wav = basename + ".wav"
     filename_mp3 = basename + ".mp3"
-    midifile.write(filename_mid)
 
-    print("\n *** Rendering MIDI")
-    os.system(
-        "fluidsynth -F {} /usr/share/sounds/sf2/FluidR3_GM.sf2 {}".format(
-            filename_wav,
+    print(f"\n *** Rendering MIDI to MP3: {filename_mid} -> {filename_mp3}")
+    # FluidSynth renders signed 16 bit little endian stereo at 44.1 kHz, which is
+    # what LAME has to be told explicitly when reading raw input.
+    fluidsynth = subprocess.Popen(
+        [
+            "fluidsynth",
+            "-q",
+            "-T",
+            "raw",
+            "-O",
+            "s16",
+            "-r",
+            "44100",
+            "-F",
+            "-",
+            "/usr/share/sounds/sf2/FluidR3_GM.sf2",
             filename_mid,
-        )
+        ],
+        stdout=subprocess.PIPE,
     )
-
-    print("\n *** Converting to MP3")
-    os.system(
-        "lame --preset standard {} {}".format(
-            filename_wav,
-            filename_mp3,
+    assert fluidsynth.stdout is not None
+    try:
+        lame = subprocess.Popen(
+            [
+                "lame",
+                "--quiet",
+                "-r",
+                "-s",
+                "44.1",
+                "--bitwidth",
+                "16",
+                "--signed",
+                "--little-endian",
+                "--preset",
+                "standard",
+                "-",
+                filename_mp3,
+            ],
+            stdin=fluidsynth.stdout,
         )
-    )
-
-    if delete_wave:
-        os.system("rm {}".format(filename_wav))
+    except BaseException:
+        # E.g. LAME is not installed, don't leave FluidSynth running.
+        fluidsynth.stdout.close()
+        fluidsynth.kill()
+        fluidsynth.wait()
+        raise
+    # Close our copy of the pipe, so that FluidSynth gets a SIGPIPE if LAME exits.
+    fluidsynth.stdout.close()
+
+    lame_returncode = lame.wait()
+    fluidsynth_returncode = fluidsynth.wait()
+    # LAME is checked first, because if it fails FluidSynth dies of a SIGPIPE as a
+    # consequence, which would hide the actual cause.
+    if lame_returncode != 0:
+        raise subprocess.CalledProcessError(lame_returncode, lame.args)
+    if fluidsynth_returncode != 0:
+        raise subprocess.CalledProcessError(fluidsynth_returncode, fluidsynth.args)
 
 
 class Note(object):
+    __slots__ = ("tick_from", "tick_upto", "pitch", "velocity")
+
     def __init__(
         self, tick_from: float, tick_upto: float, pitch: int, velocity: int = 100
     ):
@@ -83,53 +141,250 @@ class Note(object):
         self.tick_upto = tick_upto
         self.pitch = pitch
         self.velocity = velocity
-        assert tick_upto >= tick_from
 
 
 TrackId = Literal["fg", "bg"]
 
 
+def _byte_view(values: npt.NDArray[Any], dtype: "type[np.generic]") -> memoryview:
+    """
+    Raw byte view of the values in the given dtype. This only copies if the dtype
+    conversion requires it, and `array.frombytes` can consume the view directly.
+    """
+    return np.ascontiguousarray(values, dtype=dtype).data.cast("B")
+
+
+class _NoteBuffer(object):
+    """
+    Struct-of-arrays storage for the notes of a single track. No per-note objects
+    are created until a MIDI file is written. The default mido writer turns the
+    buffers directly into MIDI messages, and the pretty_midi fallback builds its
+    note objects at conversion time.
+
+    The fields are stored as `array.array` buffers, i.e., as contiguous C values
+    instead of Python objects, which NumPy can also read without copying.
+    """
+
+    def __init__(self) -> None:
+        self.tick_from: array.array[float] = array.array("d")
+        self.tick_upto: array.array[float] = array.array("d")
+        self.pitch: array.array[int] = array.array("i")
+        self.velocity: array.array[int] = array.array("i")
+
+    def __len__(self) -> int:
+        return len(self.pitch)
+
+    def append(
+        self, tick_from: float, tick_upto: float, pitch: int, velocity: int
+    ) -> None:
+        self.tick_from.append(tick_from)
+        self.tick_upto.append(tick_upto)
+        self.pitch.append(pitch)
+        self.velocity.append(velocity)
+
+    def extend(
+        self,
+        tick_from: npt.NDArray[np.float64],
+        tick_upto: npt.NDArray[np.float64],
+        pitch: npt.NDArray[np.int64],
+        velocity: int = 100,
+    ) -> None:
+        # Validate before touching any buffer, so that they always stay aligned. This
+        # mirrors the errors `array.append` raises for single notes.
+        if not np.issubdtype(pitch.dtype, np.integer):
+            raise TypeError(f"Pitches must be integers, got dtype {pitch.dtype}.")
+        intc_info = np.iinfo(np.intc)
+        if pitch.size > 0 and (
+            pitch.min() < intc_info.min or pitch.max() > intc_info.max
+        ):
+            raise OverflowError("Pitches are out of range.")
+
+        self.tick_from.frombytes(_byte_view(tick_from, np.float64))
+        self.tick_upto.frombytes(_byte_view(tick_upto, np.float64))
+        self.pitch.frombytes(_byte_view(pitch, np.intc))
+        self.velocity.extend(array.array("i", [velocity]) * pitch.size)
+
+
+Events = Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64]]
+
+
+def _assemble_events(
+    tick_from: npt.NDArray[np.int64],
+    tick_upto: npt.NDArray[np.int64],
+    pitch: npt.NDArray[np.int64],
+    velocity: npt.NDArray[np.int64],
+) -> Events:
+    """
+    Turns notes given as integer arrays into a time sorted MIDI event stream.
+    Returns the delta ticks, pitches, and velocities of the events, where note
+    offs are encoded as note ons with zero velocity (which allows for running
+    status).
+    """
+    assert (tick_upto >= tick_from).all(), "Notes must not end before they start."
+
+    n = len(pitch)
+    ticks = np.concatenate([tick_from, tick_upto])
+    pitches = np.concatenate([pitch, pitch])
+    velocities = np.concatenate([velocity, np.zeros(n, dtype=np.int64)])
+    # Note offs must come before note ons at the same tick, otherwise a repeated
+    # pitch would get cut off immediately.
+    kind = np.concatenate([np.ones(n, dtype=np.int64), np.zeros(n, dtype=np.int64)])
+
+    # Sort by (tick, kind, pitch), so that the event order is fully determined by
+    # the integer keys and does not depend on the order the notes were added in.
+    order = np.lexsort((pitches, kind, ticks))
+    sorted_ticks = ticks[order]
+    # The first delta is relative to the track start, i.e., the first tick itself.
+    deltas = np.ediff1d(sorted_ticks, to_begin=sorted_ticks[:1])
+    return deltas, pitches[order], velocities[order]
+
+
+def _note_events(data: _NoteBuffer) -> Events:
+    return _assemble_events(
+        np.round(np.asarray(data.tick_from) * PPQ_RESOLUTION).astype(np.int64),
+        np.round(np.asarray(data.tick_upto) * PPQ_RESOLUTION).astype(np.int64),
+        np.asarray(data.pitch, dtype=np.int64),
+        np.asarray(data.velocity, dtype=np.int64),
+    )
+
+
 class Generator(object):
     def __init__(self, bpm: float) -> None:
         self.bpm = bpm
-        self.data_fg: pretty_midi.Instrument = pretty_midi.Instrument(
-            program=pretty_midi.instrument_name_to_program("Acoustic Grand Piano")
-        )
-        self.data_bg: pretty_midi.Instrument = pretty_midi.Instrument(
-            program=pretty_midi.instrument_name_to_program("Acoustic Grand Piano")
-        )
-
-    def _beat_to_abs_time(self, beat: float) -> float:
-        return beat * 60 / self.bpm
+        self.data_fg = _NoteBuffer()
+        self.data_bg = _NoteBuffer()
+        self._track_map: Dict[TrackId, _NoteBuffer] = {
+            "fg": self.data_fg,
+            "bg": self.data_bg,
+        }
+
+    def _get_track(self, track_id: TrackId) -> _NoteBuffer:
+        try:
+            return self._track_map[track_id]
+        except KeyError:
+            raise ValueError("Unknown track ID.") from None
 
     def add_note(self, track_id: TrackId, note: Note) -> None:
+        self.add_note_raw(
+            track_id, note.tick_from, note.tick_upto, note.pitch, note.velocity
+        )
+
+    def add_note_raw(
+        self,
+        track_id: TrackId,
+        tick_from: float,
+        tick_upto: float,
+        pitch: int,
+        velocity: int = 100,
+    ) -> None:
+        """
+        Adds a single note given by its primitive fields, i.e., without constructing
+        an intermediate `Note`. Times are in beats. Notes can be added in any order,
+        because both writers sort the events themselves.
+        """
+        data = self._get_track(track_id)
+        data.append(tick_from, tick_upto, pitch, velocity)
+
+    def add_notes(
+        self,
+        track_id: TrackId,
+        tick_from: npt.NDArray[np.float64],
+        tick_upto: npt.NDArray[np.float64],
+        pitch: npt.NDArray[np.int64],
+    ) -> None:
+        """
+        Bulk version of `add_note_raw` taking parallel arrays.
+        """
+        data = self._get_track(track_id)
+        if pitch.ndim != 1:
+            raise ValueError(f"Note arrays must be 1-D, got shape {pitch.shape}.")
+        if not (tick_from.shape == tick_upto.shape == pitch.shape):
+            raise ValueError(
+                f"Note arrays must have equal shapes, got {tick_from.shape}, "
+                f"{tick_upto.shape}, and {pitch.shape}."
+            )
+        data.extend(tick_from, tick_upto, pitch)
+
+    def _to_instrument(self, data: _NoteBuffer) -> pretty_midi.Instrument:
         # Note that pretty_midi always uses absolute time for notes and basically
         # ignores the tempo setting of the file. Therefore we must to manually convert
         # from "beat time" to absolute time.
-        pretty_note = pretty_midi.Note(
-            velocity=100,
-            pitch=note.pitch,
-            start=self._beat_to_abs_time(note.tick_from),
-            end=self._beat_to_abs_time(note.tick_upto),
+        seconds_per_beat = 60.0 / self.bpm
+        starts = np.asarray(data.tick_from, dtype=np.float64) * seconds_per_beat
+        ends = np.asarray(data.tick_upto, dtype=np.float64) * seconds_per_beat
+        assert (ends >= starts).all(), "Notes must not end before they start."
+
+        instrument = pretty_midi.Instrument(program=_PIANO_PROGRAM)
+        instrument.notes.extend(
+            pretty_midi.Note(velocity=velocity, pitch=pitch, start=start, end=end)
+            for pitch, velocity, start, end in zip(
+                data.pitch, data.velocity, starts.tolist(), ends.tolist()
+            )
         )
-        if track_id == "fg":
-            self.data_fg.notes.append(pretty_note)
-        elif track_id == "bg":
-            self.data_bg.notes.append(pretty_note)
-        else:
-            raise ValueError("Unknown track ID.")
+        return instrument
 
     def convert_to_midi_file(self) -> pretty_midi.PrettyMIDI:
         midi_file = pretty_midi.PrettyMIDI(
             resolution=PPQ_RESOLUTION, initial_tempo=self.bpm
         )
-        midi_file.instruments.append(self.data_fg)
-        midi_file.instruments.append(self.data_bg)
+        midi_file.instruments.append(self._to_instrument(self.data_fg))
+        midi_file.instruments.append(self._to_instrument(self.data_bg))
         return midi_file
 
-    def write_midi_file(self, output_basename: str) -> None:
-        midi_file = self.convert_to_midi_file()
-        _render_midi(midi_file, output_basename)
+    def _to_midi_track(self, data: _NoteBuffer, channel: int) -> mido.MidiTrack:
+        track = mido.MidiTrack()
+        track.append(
+            mido.Message(
+                "program_change",
+                program=_PIANO_PROGRAM,
+                channel=channel,
+            )
+        )
+        # Stream the messages into the track, without building an intermediate list.
+        deltas, pitches, velocities = _note_events(data)
+        track.extend(
+            mido.Message(
+                "note_on",
+                time=delta,
+                note=pitch,
+                velocity=velocity,
+                channel=channel,
+            )
+            for delta, pitch, velocity in zip(
+                deltas.tolist(), pitches.tolist(), velocities.tolist()
+            )
+        )
+        return track
+
+    def convert_to_mido_file(self) -> mido.MidiFile:
+        """
+        Fast alternative to `convert_to_midi_file`, which builds the event streams
+        directly from the note buffers in beat time. This bypasses pretty_midi's
+        conversion to absolute time and back, and its comparison based event sort.
+        """
+        timing_track = mido.MidiTrack()
+        timing_track.append(
+            mido.MetaMessage("time_signature", numerator=4, denominator=4)
+        )
+        timing_track.append(
+            mido.MetaMessage("set_tempo", tempo=mido.bpm2tempo(self.bpm))
+        )
+
+        midi_file = mido.MidiFile(ticks_per_beat=PPQ_RESOLUTION)
+        midi_file.tracks.append(timing_track)
+        midi_file.tracks.append(self._to_midi_track(self.data_fg, channel=0))
+        midi_file.tracks.append(self._to_midi_track(self.data_bg, channel=1))
+        return midi_file
+
+    def write_midi_file(
+        self, output_basename: str, use_fast_writer: bool = True
+    ) -> None:
+        filename_mid = output_basename + ".mid"
+        if use_fast_writer:
+            self.convert_to_mido_file().save(filename_mid)
+        else:
+            self.convert_to_midi_file().write(filename_mid)
+        _render_midi(output_basename)
 
 
 # -----------------------------------------------------------------------------
@@ -137,6 +392,23 @@ class Generator(object):
 # -----------------------------------------------------------------------------
 
 
+def _tile_blocks(
+    start_pitches: npt.NDArray[np.int16],
+    offsets: npt.NDArray[np.float64],
+    deltas: npt.NDArray[np.int64],
+    block_length: float,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+    """
+    Repeats a block of notes, given by beat offsets and pitch deltas relative to
+    the block start, once per start pitch. Consecutive blocks are `block_length`
+    beats apart. Returns the flattened start beats and pitches in note order.
+    """
+    block_starts = np.arange(len(start_pitches), dtype=np.float64) * block_length
+    tick_from = (block_starts[:, None] + offsets[None, :]).ravel()
+    pitches = (start_pitches.astype(np.int64)[:, None] + deltas[None, :]).ravel()
+    return tick_from, pitches
+
+
 def generator_major_triad(
     bpm: float = 120.0,
     low: int = pretty_midi.note_name_to_number("A3"),
@@ -148,14 +420,20 @@ def generator_major_triad(
     pattern = [0, 4, 7, 12, 7, 4, 0]
 
     start_pitches = get_start_pitches(pattern, low, high)
+    block_length = (len(pattern) + 1) * note_length
 
-    pos = 0.0
-    for start_pitch in start_pitches:
-        data.add_note("bg", Note(pos, pos + note_length * 8, start_pitch - 12))
-        for delta in pattern:
-            data.add_note("fg", Note(pos, pos + note_length, start_pitch + delta))
-            pos += note_length
-        pos += note_length
+    tick_from, pitches = _tile_blocks(
+        start_pitches, np.zeros(1), np.array([-12]), block_length
+    )
+    data.add_notes("bg", tick_from, tick_from + note_length * 8, pitches)
+
+    tick_from, pitches = _tile_blocks(
+        start_pitches,
+        np.arange(len(pattern), dtype=np.float64) * note_length,
+        np.array(pattern),
+        block_length,
+    )
+    data.add_notes("fg", tick_from, tick_from + note_length, pitches)
 
     return data
 
@@ -171,18 +449,43 @@ def generator_major_scale(
     pattern = [0, 2, 4, 5, 7, 9, 11, 12, 11, 9, 7, 5, 4, 2, 0]
 
     start_pitches = get_start_pitches(pattern, low, high)
+    block_length = (len(pattern) + 1) * note_length
 
-    pos = 0.0
-    for start_pitch in start_pitches:
-        data.add_note("bg", Note(pos, pos + note_length * 16, start_pitch - 12))
-        for delta in pattern:
-            data.add_note("fg", Note(pos, pos + note_length, start_pitch + delta))
-            pos += note_length
-        pos += note_length
+    tick_from, pitches = _tile_blocks(
+        start_pitches, np.zeros(1), np.array([-12]), block_length
+    )
+    data.add_notes("bg", tick_from, tick_from + note_length * 16, pitches)
+
+    tick_from, pitches = _tile_blocks(
+        start_pitches,
+        np.arange(len(pattern), dtype=np.float64) * note_length,
+        np.array(pattern),
+        block_length,
+    )
+    data.add_notes("fg", tick_from, tick_from + note_length, pitches)
 
     return data
 
 
+@functools.lru_cache(maxsize=128)
+def _triad_opener_block(
+    pattern: Tuple[int, ...], note_length: float
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+    """
+    Beat offsets and pitch deltas of a single loop of the triad opener, which are
+    fixed per pattern. The returned arrays are cached and therefore read-only.
+    """
+    # Per loop: 1. start pitch, 2. the triad, 3. the pattern, 4. a break
+    offsets = (
+        np.concatenate([[0.0, 1.0, 1.0, 1.0], np.arange(len(pattern)) + 2.0])
+        * note_length
+    )
+    deltas = np.array((0, 0, pattern[2], pattern[4]) + pattern, dtype=np.int64)
+    offsets.setflags(write=False)
+    deltas.setflags(write=False)
+    return offsets, deltas
+
+
 def generator_scale_with_triad_opener(
     pattern: Pattern,
     bpm: float = 140.0,
@@ -204,99 +507,108 @@ def generator_scale_with_triad_opener(
     start_pitches = get_start_pitches(pattern, low, high)
     print(f"Total start pitches: {len(start_pitches)}")
 
+    offsets, deltas = _triad_opener_block(tuple(pattern), note_length)
+    block_length = (len(pattern) + 3) * note_length
+
     data = Generator(bpm)
-    pos = 0.0
-    for start_pitch in start_pitches:
-        # 1. start pitch
-        data.add_note("fg", Note(pos, pos + note_length, start_pitch))
-        pos += note_length
+    tick_from, pitches = _tile_blocks(start_pitches, offsets, deltas, block_length)
+    data.add_notes("fg", tick_from, tick_from + note_length, pitches)
 
-        # 2. the triad
-        data.add_note("fg", Note(pos, pos + note_length, start_pitch))
-        data.add_note("fg", Note(pos, pos + note_length, start_pitch + pattern[2]))
-        data.add_note("fg", Note(pos, pos + note_length, start_pitch + pattern[4]))
-        pos += note_length
+    return data
 
-        for delta in pattern:
-            data.add_note("fg", Note(pos, pos + note_length, start_pitch + delta))
-            pos += note_length
 
-        # break in between loops
-        pos += note_length
+_EB2 = pretty_midi.note_name_to_number("Eb2")
+_B2 = pretty_midi.note_name_to_number("B2")
+_F3 = pretty_midi.note_name_to_number("F3")
+_CS4 = pretty_midi.note_name_to_number("C#4")
+_G4 = pretty_midi.note_name_to_number("G4")
+_A4 = pretty_midi.note_name_to_number("A4")
 
-    return data
+GeneratorSpec = Tuple[Callable[..., Generator], Dict[str, Any], str]
+
+
+def _run_generator_spec(spec: GeneratorSpec) -> None:
+    generator_func, kwargs, output_basename = spec
+    generator_func(**kwargs).write_midi_file(output_basename)
 
 
 def main() -> None:
+    specs: List[GeneratorSpec] = []
+
     generate_basics = False
     if generate_basics:
-        generator_major_triad().write_midi_file("major_triad")
-        generator_major_scale().write_midi_file("major_scale")
+        specs.append((generator_major_triad, {}, "major_triad"))
+        specs.append((generator_major_scale, {}, "major_scale"))
 
     generate_modes = False
     if generate_modes:
-        generator_scale_with_triad_opener(
-            [0, 2, 4, 6, 7, 9, 11, 12],
-        ).write_midi_file("scale_plain_lydian")
-        generator_scale_with_triad_opener(
-            [0, 2, 4, 5, 7, 9, 11, 12],
-        ).write_midi_file("scale_plain_ionian")
-        generator_scale_with_triad_opener(
-            [0, 2, 4, 5, 7, 9, 10, 12],
-        ).write_midi_file("scale_plain_mixolydian")
-        generator_scale_with_triad_opener(
-            [0, 2, 3, 5, 7, 9, 10, 12],
-        ).write_midi_file("scale_plain_dorian")
-        generator_scale_with_triad_opener(
-            [0, 2, 3, 5, 7, 8, 10, 12],
-        ).write_midi_file("scale_plain_aeolian")
-        generator_scale_with_triad_opener(
-            [0, 1, 3, 5, 7, 8, 10, 12],
-        ).write_midi_file("scale_plain_phrygian")
-        generator_scale_with_triad_opener(
-            [0, 1, 3, 5, 6, 8, 10, 12],
-        ).write_midi_file("scale_plain_locrian")
+        modes = [
+            ("lydian", [0, 2, 4, 6, 7, 9, 11, 12]),
+            ("ionian", [0, 2, 4, 5, 7, 9, 11, 12]),
+            ("mixolydian", [0, 2, 4, 5, 7, 9, 10, 12]),
+            ("dorian", [0, 2, 3, 5, 7, 9, 10, 12]),
+            ("aeolian", [0, 2, 3, 5, 7, 8, 10, 12]),
+            ("phrygian", [0, 1, 3, 5, 7, 8, 10, 12]),
+            ("locrian", [0, 1, 3, 5, 6, 8, 10, 12]),
+        ]
+        for mode_name, pattern in modes:
+            specs.append(
+                (
+                    generator_scale_with_triad_opener,
+                    dict(pattern=pattern),
+                    f"scale_plain_{mode_name}",
+                )
+            )
 
     generate_long_scale = False
     if generate_long_scale:
         long_scale_pattern = [0, 4, 7, 12, 16, 19, 17, 14, 11, 7, 5, 2, 0]
-        generator_scale_with_triad_opener(
-            long_scale_pattern,
-            bpm=160,
-            low=pretty_midi.note_name_to_number("Eb2"),
-            high=pretty_midi.note_name_to_number("A4"),
-            do_close_pattern=False,
-        ).write_midi_file("long_scale_middle")
-        generator_scale_with_triad_opener(
-            long_scale_pattern,
-            bpm=160,
-            low=pretty_midi.note_name_to_number("Eb2"),
-            high=pretty_midi.note_name_to_number("C#4"),
-            do_close_pattern=False,
-        ).write_midi_file("long_scale_low")
-        generator_scale_with_triad_opener(
-            long_scale_pattern,
-            bpm=160,
-            low=pretty_midi.note_name_to_number("B2"),
-            high=pretty_midi.note_name_to_number("A4"),
-            do_close_pattern=False,
-        ).write_midi_file("long_scale_high")
+        long_scale_ranges = [
+            ("middle", _EB2, _A4),
+            ("low", _EB2, _CS4),
+            ("high", _B2, _A4),
+        ]
+        for suffix, low, high in long_scale_ranges:
+            specs.append(
+                (
+                    generator_scale_with_triad_opener,
+                    dict(
+                        pattern=long_scale_pattern,
+                        bpm=160,
+                        low=low,
+                        high=high,
+                        do_close_pattern=False,
+                    ),
+                    f"long_scale_{suffix}",
+                )
+            )
 
     generate_chromatic = True
     if generate_chromatic:
         chromatic_pattern = list(range(8))
-        generator_scale_with_triad_opener(
-            chromatic_pattern,
-            bpm=160,
-            low=pretty_midi.note_name_to_number("Eb2"),
-            high=pretty_midi.note_name_to_number("F3"),
-        ).write_midi_file("chromatic_low")
-        generator_scale_with_triad_opener(
-            chromatic_pattern,
-            bpm=160,
-            low=pretty_midi.note_name_to_number("F3"),
-            high=pretty_midi.note_name_to_number("G4"),
-        ).write_midi_file("chromatic_high")
+        chromatic_ranges = [
+            ("low", _EB2, _F3),
+            ("high", _F3, _G4),
+        ]
+        for suffix, low, high in chromatic_ranges:
+            specs.append(
+                (
+                    generator_scale_with_triad_opener,
+                    dict(
+                        pattern=chromatic_pattern,
+                        bpm=160,
+                        low=low,
+                        high=high,
+                    ),
+                    f"chromatic_{suffix}",
+                )
+            )
+
+    # The generated files are independent, so render them in parallel. Only half
+    # of the CPUs are used, because FluidSynth may spawn additional audio threads.
+    max_workers = max(1, (os.cpu_count() or 1) // 2)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_run_generator_spec, specs))
 
 
 if __name__ == "__main__":
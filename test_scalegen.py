@@ -1,25 +1,145 @@
-from scalegen import close_pattern, get_start_pitches
+import io
+from typing import List, Tuple
+
+import numpy as np
+import pretty_midi
+import pytest
+
+from scalegen import (
+    Generator,
+    Note,
+    _assemble_events,
+    close_pattern,
+    generator_major_triad,
+    generator_scale_with_triad_opener,
+    get_start_pitches,
+)
 
 
 def test_get_start_pitches() -> None:
-    assert get_start_pitches([0, 1, 2], 20, 22, False) == [20]
-    assert get_start_pitches([0, 1, 2], 20, 23, False) == [20, 21]
-    assert get_start_pitches([0, 1, 2], 20, 24, False) == [20, 21, 22]
+    assert get_start_pitches([0, 1, 2], 20, 22, False).tolist() == [20]
+    assert get_start_pitches([0, 1, 2], 20, 23, False).tolist() == [20, 21]
+    assert get_start_pitches([0, 1, 2], 20, 24, False).tolist() == [20, 21, 22]
 
 
 def test_get_start_pitches__positive_and_negative() -> None:
-    assert get_start_pitches([-1, +1], 20, 22, False) == [21]
-    assert get_start_pitches([-1, +1], 20, 23, False) == [21, 22]
+    assert get_start_pitches([-1, +1], 20, 22, False).tolist() == [21]
+    assert get_start_pitches([-1, +1], 20, 23, False).tolist() == [21, 22]
 
-    assert get_start_pitches([+2, +3], 20, 22, False) == [18, 19]
-    assert get_start_pitches([-2, -3], 20, 22, False) == [23, 24]
+    assert get_start_pitches([+2, +3], 20, 22, False).tolist() == [18, 19]
+    assert get_start_pitches([-2, -3], 20, 22, False).tolist() == [23, 24]
 
 
 def test_get_start_pitches__cycle_up_and_down() -> None:
-    assert get_start_pitches([0, 1, 2], 20, 22) == [20]
-    assert get_start_pitches([0, 1, 2], 20, 23) == [20, 21, 20]
-    assert get_start_pitches([0, 1, 2], 20, 24) == [20, 21, 22, 21, 20]
+    assert get_start_pitches([0, 1, 2], 20, 22).tolist() == [20]
+    assert get_start_pitches([0, 1, 2], 20, 23).tolist() == [20, 21, 20]
+    assert get_start_pitches([0, 1, 2], 20, 24).tolist() == [20, 21, 22, 21, 20]
 
 
 def test_close_pattern() -> None:
     assert close_pattern([0, 1, 2]) == [0, 1, 2, 1, 0]
+
+
+def test_generator_major_triad() -> None:
+    data = generator_major_triad(low=48, high=61)
+
+    assert list(data.data_bg.tick_from) == [0.0, 8.0, 16.0]
+    assert list(data.data_bg.tick_upto) == [8.0, 16.0, 24.0]
+    assert list(data.data_bg.pitch) == [36, 37, 36]
+
+    assert len(data.data_fg) == 3 * 7
+    assert list(data.data_fg.tick_from[:8]) == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 8.0]
+    assert list(data.data_fg.pitch[:8]) == [48, 52, 55, 60, 55, 52, 48, 49]
+
+
+def test_add_notes__mismatching_shapes() -> None:
+    data = Generator(120.0)
+    with pytest.raises(ValueError):
+        data.add_notes("fg", np.array([2.0, 3.0]), np.array([3.0]), np.array([64, 65]))
+    with pytest.raises(ValueError):
+        data.add_notes("fg", np.zeros((2, 3)), np.ones((2, 3)), np.full((2, 3), 60))
+
+    assert len(data.data_fg) == 0
+    assert len(data.data_fg.tick_from) == 0
+    assert len(data.data_fg.tick_upto) == 0
+    assert len(data.data_fg.velocity) == 0
+
+
+def test_add_notes__invalid_pitches() -> None:
+    data = Generator(120.0)
+    with pytest.raises(TypeError):
+        data.add_notes("fg", np.zeros(1), np.ones(1), np.array([60.7]))
+    with pytest.raises(OverflowError):
+        data.add_notes("fg", np.zeros(1), np.ones(1), np.array([2**32 + 60]))
+
+    assert len(data.data_fg.tick_from) == 0
+    assert len(data.data_fg.pitch) == 0
+
+
+def test_assemble_events__ordering() -> None:
+    # Pitch 60 is repeated at tick 10, and pitches 67 and 64 start together at 20.
+    deltas, pitches, velocities = _assemble_events(
+        np.array([0, 10, 20, 20]),
+        np.array([10, 20, 30, 30]),
+        np.array([60, 60, 67, 64]),
+        np.array([100, 90, 80, 70]),
+    )
+
+    # Note offs precede note ons at the same tick, and events of the same kind at
+    # the same tick are ordered by pitch.
+    assert deltas.tolist() == [0, 10, 0, 10, 0, 0, 10, 0]
+    assert pitches.tolist() == [60, 60, 60, 60, 64, 67, 64, 67]
+    assert velocities.tolist() == [100, 0, 90, 0, 70, 80, 0, 0]
+
+
+def _read_notes(midi_bytes: io.BytesIO) -> List[List[Tuple[int, int, int, int]]]:
+    midi_bytes.seek(0)
+    midi_file = pretty_midi.PrettyMIDI(midi_bytes)
+    return [
+        sorted(
+            (
+                midi_file.time_to_tick(note.start),
+                midi_file.time_to_tick(note.end),
+                note.pitch,
+                note.velocity,
+            )
+            for note in instrument.notes
+        )
+        for instrument in midi_file.instruments
+    ]
+
+
+def test_convert_to_mido_file__matches_pretty_midi() -> None:
+    for data in [
+        generator_major_triad(low=48, high=62),
+        generator_scale_with_triad_opener([0, 2, 4, 5, 7], low=48, high=62),
+    ]:
+        fast = io.BytesIO()
+        data.convert_to_mido_file().save(file=fast)
+        slow = io.BytesIO()
+        data.convert_to_midi_file().write(slow)
+
+        assert _read_notes(fast) == _read_notes(slow)
+
+
+def test_add_note__single_notes() -> None:
+    data = Generator(120.0)
+    data.add_note_raw("fg", 1.0, 2.0, 62, 90)
+    data.add_note("fg", Note(0.0, 1.0, 60))
+    data.add_note("bg", Note(0.0, 2.0, 48, 80))
+
+    with pytest.raises(ValueError):
+        data.add_note("xx", Note(0.0, 1.0, 60))  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        data.add_note_raw("xx", 0.0, 1.0, 60)  # type: ignore[arg-type]
+
+    expected = [
+        [(0, 960, 60, 100), (960, 1920, 62, 90)],
+        [(0, 1920, 48, 80)],
+    ]
+    fast = io.BytesIO()
+    data.convert_to_mido_file().save(file=fast)
+    assert _read_notes(fast) == expected
+    slow = io.BytesIO()
+    data.convert_to_midi_file().write(slow)
+    assert _read_notes(slow) == expected